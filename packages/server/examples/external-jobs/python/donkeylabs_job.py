@@ -18,13 +18,177 @@ Usage:
         run_job(my_job)
 """
 
+import itertools
 import json
+import logging
 import os
 import socket
 import sys
 import threading
 import time
-from typing import Any, Callable, Dict, Optional
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("donkeylabs")
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects some values the stdlib accepts (e.g. integers
+            # beyond 64 bits); JSONEncodeError subclasses TypeError
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Initial size of the writer's reusable send buffer; it is shrunk back to this
+# after flushing a batch that made it grow past _SEND_BUF_MAX_RETAINED
+_SEND_BUF_SIZE = 4096
+_SEND_BUF_MAX_RETAINED = 1 << 20
+
+# Socket constants resolved once for the (re)connect path; AF_UNIX is
+# missing on some Windows builds
+_AF_INET = socket.AF_INET
+_AF_UNIX = getattr(socket, "AF_UNIX", None)
+_SOCK_STREAM = socket.SOCK_STREAM
+
+# Send buffer requested on every socket so a full batch fits without short
+# writes; the kernel may clamp it (e.g. net.core.wmem_max on Linux)
+_SOCKET_SNDBUF = 1 << 20
+
+# Report a closed peer as EPIPE instead of raising SIGPIPE (Linux); platforms
+# without it use the SO_NOSIGPIPE socket option instead where available
+_MSG_NOSIGNAL = getattr(socket, "MSG_NOSIGNAL", 0)
+
+# Repeated "connection lost" warnings within this many seconds are counted, not logged
+_LOG_THROTTLE_INTERVAL = 1.0
+
+# Reconnect backoff starts here and doubles up to reconnect_interval
+_RECONNECT_BASE_DELAY = 0.1
+
+# Message types shed when the outbox fills up during an outage, least important
+# first; logs only go once no progress updates are left. Anything else
+# (started/completed/failed) is never dropped; heartbeats are generated by the
+# writer itself and never queued. While connected nothing is shed: producers
+# wait for the writer to make room instead.
+_SHED_ORDER = ("progress", "log")
+
+# Message types the writer flushes immediately instead of lingering, so they
+# are never left sitting in the send buffer when the process exits
+_FLUSH_NOW = frozenset(("started", "completed", "failed"))
+
+
+class _Outbox:
+    """
+    Bounded FIFO of encoded messages.
+
+    When full, producers wait for the consumer to make room, unless shedding
+    is enabled (the writer does this while the connection is down), in which
+    case the least important message is dropped instead.
+
+    Each shed class has its own FIFO, so shedding is a popleft on the right
+    one; a shared sequence number restores the overall order on drain. A
+    drain only takes entries numbered before it started, so a message never
+    ships ahead of an earlier one from the same producer that it raced with.
+    Producers append without taking a lock (deque.append and the counter are
+    atomic) and only signal the consumer when it isn't already signalled. The
+    lock is only taken by the consumer once per drain and by producers that
+    overflow.
+    """
+
+    def __init__(self, maxsize: int):
+        self._queues: Dict[str, Deque[Tuple[int, str, bytes]]] = {kind: deque() for kind in _SHED_ORDER}
+        self._other: Deque[Tuple[int, str, bytes]] = deque()
+        self._seq = itertools.count()
+        self._maxsize = maxsize
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._shedding = False
+        self._closed = False
+        self._dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._other) + sum(len(q) for q in self._queues.values())
+
+    def put(self, kind: str, data: bytes) -> None:
+        """Append a message, first waiting for room (or shedding) if full."""
+        if len(self) >= self._maxsize:
+            self._make_room()
+        self._queues.get(kind, self._other).append((next(self._seq), kind, data))
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def _make_room(self) -> None:
+        with self._not_full:
+            while len(self) >= self._maxsize and not self._closed:
+                if not self._shedding:
+                    self._not_full.wait()
+                    continue
+                for shed_kind in _SHED_ORDER:
+                    queue = self._queues[shed_kind]
+                    if queue:
+                        queue.popleft()
+                        self._dropped += 1
+                        break
+                else:
+                    # Only messages that are never dropped are left
+                    return
+
+    def set_shedding(self, shedding: bool) -> None:
+        """Choose whether a full outbox drops messages (True) or makes producers wait."""
+        with self._not_full:
+            self._shedding = shedding
+            if shedding:
+                self._not_full.notify_all()
+
+    def drain(self, timeout: Optional[float] = None) -> Optional[Tuple[List[Tuple[str, bytes]], int]]:
+        """
+        Wait up to timeout seconds (forever if None) for messages, then take them all.
+
+        Returns the (type, data) pairs and how many were dropped since the last
+        drain, or None once the outbox is closed and empty. The list is empty if
+        the timeout expired first.
+        """
+        if not len(self) and not self._closed:
+            self._ready.wait(timeout)
+        # Clear before taking items so a put that lands afterwards re-signals
+        self._ready.clear()
+        # Read closed before taking items: a put() followed by close() must not
+        # land between an empty take and the check, or its message is lost
+        closed = self._closed
+        entries: List[Tuple[int, str, bytes]] = []
+        with self._lock:
+            # Anything numbered from here on is left for the next drain; an
+            # earlier message from the same producer may not be taken yet
+            limit = next(self._seq)
+            for queue in (*self._queues.values(), self._other):
+                while queue and queue[0][0] < limit:
+                    entries.append(queue.popleft())
+            dropped, self._dropped = self._dropped, 0
+            if entries:
+                self._not_full.notify_all()
+        if not entries:
+            return None if closed else ([], 0)
+        # Each queue is already in order, so this just merges the runs
+        entries.sort(key=lambda entry: entry[0])
+        return [(kind, data) for _, kind, data in entries], dropped
+
+    def close(self) -> None:
+        """Wake the consumer; drain() returns None once the remaining messages are taken."""
+        with self._not_full:
+            self._closed = True
+            # Producers waiting for room append anyway; the writer is finishing up
+            self._not_full.notify_all()
+        self._ready.set()
 
 
 class DonkeylabsJob:
@@ -39,28 +203,64 @@ class DonkeylabsJob:
         heartbeat_interval: float = 5.0,
         reconnect_interval: float = 2.0,
         max_reconnect_attempts: int = 30,
+        socket_options: Optional[List[Tuple[int, int, int]]] = None,
+        max_queued_messages: int = 1024,
+        flush_interval: float = 0.01,
+        write_buffer_size: int = 8192,
+        batch_frames: bool = False,
     ):
         self.job_id = job_id
         self.name = name
         self.data = data
+        # jobId never changes, so serialize it once and splice it into every message
+        self._message_prefix = b'{"jobId":' + _dumps(job_id) + b',"timestamp":'
+        # Heartbeats only vary by timestamp, so everything before it is constant
+        self._heartbeat_prefix = b'{"type":"heartbeat","jobId":' + _dumps(job_id) + b',"timestamp":'
+        self._batch_header = b'{"type":"batch","jobId":' + _dumps(job_id) + b',"items":['
         self._socket_path = socket_path
         self._heartbeat_interval = heartbeat_interval
         self._reconnect_interval = reconnect_interval
         self._max_reconnect_attempts = max_reconnect_attempts
+        # Extra (level, optname, value) tuples applied to every new socket
+        self._socket_options = list(socket_options or [])
+        # The writer lingers up to flush_interval to coalesce small messages,
+        # unless write_buffer_size bytes are already buffered
+        self._flush_interval = flush_interval
+        self._write_buffer_size = write_buffer_size
+        # Wrap multi-message flushes in one {"type":"batch"} line (needs a server
+        # that understands batch frames, so it is opt-in)
+        self._batch_frames = batch_frames
         self._socket: Optional[socket.socket] = None
-        self._heartbeat_thread: Optional[threading.Thread] = None
-        self._reconnect_thread: Optional[threading.Thread] = None
-        self._running = False
+        self._writer_thread: Optional[threading.Thread] = None
+        # Encoded lines waiting for the writer thread
+        self._outbox = _Outbox(max_queued_messages)
+        # Only touched by the writer thread, so no lock is needed
+        self._send_buf = bytearray(_SEND_BUF_SIZE)
         self._connected = False
-        self._lock = threading.Lock()
+        # Set on disconnect so a pending reconnect backoff wakes up immediately
+        self._stop_event = threading.Event()
+        # Monotonic time of the last successful write; any message doubles as a heartbeat
+        self._last_send_ts = 0.0
+        # (suppressed count, monotonic time of last log) for connection-lost warnings
+        self._log_throttle = (0, 0.0)
         self._reconnect_lock = threading.Lock()
 
+    def consume_data(self) -> Any:
+        """
+        Return the job data and drop the job's own reference to it.
+
+        Use this instead of `job.data` for large payloads so they can be
+        garbage collected once the handler no longer needs them.
+        """
+        data = self.data
+        self.data = None
+        return data
+
     def connect(self) -> None:
         """Connect to the job server socket."""
         self._do_connect()
-        self._running = True
         self._connected = True
-        self._start_heartbeat()
+        self._start_writer()
         self._send_started()
 
     def _do_connect(self) -> None:
@@ -69,22 +269,60 @@ class DonkeylabsJob:
             # TCP connection (Windows fallback)
             addr = self._socket_path[6:]  # Remove "tcp://"
             host, port = addr.rsplit(":", 1)
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._socket.connect((host, int(port)))
+            family = _AF_INET
+            address: Any = (host, int(port))
         else:
             # Unix socket
-            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self._socket.connect(self._socket_path)
+            if _AF_UNIX is None:
+                raise RuntimeError(
+                    "Unix sockets are not supported on this platform; "
+                    f"expected a tcp:// socket path, got {self._socket_path!r}"
+                )
+            family = _AF_UNIX
+            address = self._socket_path
+
+        self._socket = socket.socket(family, _SOCK_STREAM)
+        self._apply_socket_options()
+        # Bound connect() by the retry interval so an unresponsive peer can't
+        # stall an attempt for the kernel's full SYN retry timeout
+        self._socket.settimeout(self._reconnect_interval)
+        self._socket.connect(address)
+        if family == _AF_INET:
+            # Messages are small JSON lines; don't let Nagle hold them back
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        # Sends rely on blocking mode: send() waits for buffer space rather
+        # than failing with EAGAIN mid-batch
+        self._socket.setblocking(True)
+
+    def _apply_socket_options(self) -> None:
+        """Apply send buffer sizing, SIGPIPE suppression and user-supplied options to the current socket."""
+        try:
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_SNDBUF)
+        except OSError:
+            pass  # Best effort; some platforms reject sizes above their limit
+        if not _MSG_NOSIGNAL and hasattr(socket, "SO_NOSIGPIPE"):
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_NOSIGPIPE, 1)
+        for level, optname, value in self._socket_options:
+            self._socket.setsockopt(level, optname, value)
 
     def _try_reconnect(self) -> bool:
-        """Attempt to reconnect to the server (for server restart resilience)."""
+        """
+        Attempt to reconnect to the server (for server restart resilience).
+
+        Runs on the writer thread, retrying with exponential backoff capped at
+        reconnect_interval. Time spent in a failed connect counts towards the
+        backoff, so all attempts finish within max_reconnect_attempts *
+        reconnect_interval.
+        """
         with self._reconnect_lock:
             if self._connected:
                 return True
 
-            print(f"[DonkeylabsJob] Attempting to reconnect...", file=sys.stderr)
+            logger.warning("Attempting to reconnect...")
 
             for attempt in range(self._max_reconnect_attempts):
+                attempt_start = time.monotonic()
                 try:
                     # Close old socket
                     if self._socket:
@@ -95,82 +333,227 @@ class DonkeylabsJob:
 
                     # Try to reconnect
                     self._do_connect()
-                    self._connected = True
-                    print(f"[DonkeylabsJob] Reconnected after {attempt + 1} attempts", file=sys.stderr)
 
-                    # Send started message to let server know we're back
-                    self._send_started()
+                    # Let the server know we're back before the writer flushes
+                    # anything that was buffered during the outage
+                    self._sendall(self._encode_message({"type": "started"}))
+                    self._connected = True
+                    logger.warning("Reconnected after %d attempts", attempt + 1)
                     return True
                 except Exception as e:
-                    print(f"[DonkeylabsJob] Reconnect attempt {attempt + 1}/{self._max_reconnect_attempts} failed: {e}", file=sys.stderr)
-                    time.sleep(self._reconnect_interval)
-
-            print(f"[DonkeylabsJob] Failed to reconnect after {self._max_reconnect_attempts} attempts", file=sys.stderr)
+                    logger.warning("Reconnect attempt %d/%d failed: %s", attempt + 1, self._max_reconnect_attempts, e)
+                    delay = min(self._reconnect_interval, _RECONNECT_BASE_DELAY * 2 ** attempt)
+                    delay -= time.monotonic() - attempt_start
+                    if self._stop_event.wait(max(0.0, delay)):
+                        # Disconnecting; stop retrying
+                        return False
+
+            logger.error("Failed to reconnect after %d attempts", self._max_reconnect_attempts)
             return False
 
     def disconnect(self) -> None:
         """Disconnect from the job server."""
-        self._running = False
-        if self._heartbeat_thread:
-            self._heartbeat_thread.join(timeout=2.0)
+        self._stop_event.set()
+        if self._writer_thread:
+            # Let the writer flush whatever is still queued before closing
+            self._outbox.close()
+            self._writer_thread.join(timeout=2.0)
         if self._socket:
             try:
                 self._socket.close()
             except Exception:
                 pass
 
+    def _encode_message(self, message: Dict[str, Any]) -> bytes:
+        """Encode a message as a JSON line stamped with the job ID and timestamp."""
+        body = _dumps(message)
+        timestamp = str(time.time_ns() // 1_000_000).encode("ascii")
+        if len(body) <= 2:
+            return b"".join((self._message_prefix, timestamp, b"}\n"))
+        # body is "{...}"; reuse its fields and closing brace after the prefix
+        return b"".join((self._message_prefix, timestamp, b",", memoryview(body)[1:], b"\n"))
+
     def _send_message(self, message: Dict[str, Any]) -> bool:
-        """Send a JSON message to the server. Returns True if sent successfully."""
+        """Queue a JSON message for the writer thread. Returns True if queued successfully."""
         if not self._socket:
             return False
 
-        message["jobId"] = self.job_id
-        message["timestamp"] = int(time.time() * 1000)
+        try:
+            data = self._encode_message(message)
+        except Exception as e:
+            logger.error("Failed to send message: %s", e)
+            return False
+
+        self._outbox.put(message.get("type", ""), data)
+        return True
 
-        with self._lock:
+    def _encode_heartbeat(self) -> bytes:
+        """Build a heartbeat line from the pre-serialized prefix."""
+        timestamp = str(time.time_ns() // 1_000_000).encode("ascii")
+        return self._heartbeat_prefix + timestamp + b"}\n"
+
+    def _start_writer(self) -> None:
+        """Start the background thread that owns all socket writes and heartbeats."""
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+    def _writer_loop(self) -> None:
+        """
+        Drain the outbox into the reusable send buffer and flush it in batches.
+
+        Small messages linger for up to flush_interval so bursts of log and
+        progress calls share one write. The buffer is flushed early once it
+        holds write_buffer_size bytes or a started/completed/failed message,
+        and always before the writer exits.
+
+        When nothing has been written for heartbeat_interval, the writer sends
+        a heartbeat itself, so no separate heartbeat thread is needed.
+
+        Messages replayed after a reconnect carry their original timestamps,
+        and the server takes lastHeartbeat from them. Once everything queued
+        during the outage has been sent, the writer follows it with a fresh
+        heartbeat so lastHeartbeat is not left rolled back to before the outage.
+
+        With batch_frames, messages are written comma-separated after room
+        reserved for the batch header, which is filled in at flush time.
+        """
+        base = len(self._batch_header) if self._batch_frames else 0
+        used = base
+        count = 0
+        deadline: Optional[float] = None
+        # The started message that follows connect() covers the first interval
+        last_heartbeat = time.monotonic()
+        replay_pending = False
+
+        while True:
+            # Any write doubles as a heartbeat; also space out heartbeats that
+            # failed to go out so an outage doesn't turn into a busy loop
+            next_heartbeat = max(self._last_send_ts, last_heartbeat) + self._heartbeat_interval
+            if replay_pending:
+                wake_at = time.monotonic()
+            else:
+                wake_at = deadline if count else next_heartbeat
+            batch = self._outbox.drain(max(0.0, wake_at - time.monotonic()))
+            if batch is None:
+                if count:
+                    self._flush_messages(base, used, count)
+                break
+
+            items, dropped = batch
+            flush_now = False
+            if replay_pending:
+                # This drain took everything queued before the reconnect finished
+                items.append(("heartbeat", self._encode_heartbeat()))
+                flush_now = True
+                replay_pending = False
+            elif not items and not count and time.monotonic() >= next_heartbeat:
+                last_heartbeat = time.monotonic()
+                items = [("heartbeat", self._encode_heartbeat())]
+                flush_now = True
+            for i, (kind, data) in enumerate(items):
+                if i == 0 and dropped:
+                    # Tell the server how many messages the outbox shed
+                    data = data[:-2] + b',"dropped":' + str(dropped).encode("ascii") + b"}\n"
+                if self._batch_frames:
+                    if count:
+                        used = self._buffer_append(used, b",")
+                    used = self._buffer_append(used, memoryview(data)[:-1])
+                else:
+                    used = self._buffer_append(used, data)
+                count += 1
+                flush_now = flush_now or kind in _FLUSH_NOW
+
+            if not count:
+                continue
+            if deadline is None:
+                deadline = time.monotonic() + self._flush_interval
+            if flush_now or used >= self._write_buffer_size or time.monotonic() >= deadline:
+                replay_pending = self._flush_messages(base, used, count)
+                used = base
+                count = 0
+                deadline = None
+
+    def _flush_messages(self, base: int, used: int, count: int) -> bool:
+        """
+        Frame the buffered messages (as a batch if several are pending) and flush them.
+
+        Returns True if the flush had to reconnect.
+        """
+        if not self._batch_frames:
+            return self._flush(0, used)
+        elif count == 1:
+            return self._flush(base, self._buffer_append(used, b"\n"))
+        else:
+            self._send_buf[:base] = self._batch_header
+            return self._flush(0, self._buffer_append(used, b"]}\n"))
+
+    def _flush(self, start: int, end: int) -> bool:
+        """
+        Write send buffer bytes start:end. Returns True if it had to reconnect.
+
+        If the connection is down the writer reconnects inline while new
+        messages wait in the outbox, which sheds rather than blocking producers
+        until the connection is back. If reconnecting fails the buffered
+        messages are dropped.
+        """
+        reconnected = False
+        while True:
+            if not self._connected:
+                self._outbox.set_shedding(True)
+                if not self._try_reconnect():
+                    logger.error("Reconnection failed, dropping %d bytes of queued messages", end - start)
+                    break
+                self._outbox.set_shedding(False)
+                reconnected = True
+
+            view = memoryview(self._send_buf)[start:end]
             try:
-                data = json.dumps(message) + "\n"
-                self._socket.sendall(data.encode("utf-8"))
-                return True
+                self._sendall(view)
+                self._last_send_ts = time.monotonic()
+                break
             except (BrokenPipeError, ConnectionResetError, OSError) as e:
-                print(f"[DonkeylabsJob] Connection lost: {e}", file=sys.stderr)
+                self._warn_connection_lost(e)
                 self._connected = False
-
-                # Try to reconnect in background (don't block the caller)
-                if self._running and not self._reconnect_thread:
-                    self._reconnect_thread = threading.Thread(
-                        target=self._reconnect_loop,
-                        daemon=True
-                    )
-                    self._reconnect_thread.start()
-                return False
-            except Exception as e:
-                print(f"[DonkeylabsJob] Failed to send message: {e}", file=sys.stderr)
-                return False
-
-    def _reconnect_loop(self) -> None:
-        """Background thread that attempts to reconnect."""
-        if self._try_reconnect():
-            print(f"[DonkeylabsJob] Reconnection successful, resuming operation", file=sys.stderr)
+            finally:
+                view.release()
+
+        if len(self._send_buf) > _SEND_BUF_MAX_RETAINED:
+            self._send_buf = bytearray(_SEND_BUF_SIZE)
+        return reconnected
+
+    def _warn_connection_lost(self, error: Exception) -> None:
+        """Log a lost connection, at most once per _LOG_THROTTLE_INTERVAL."""
+        suppressed, last_ts = self._log_throttle
+        now = time.monotonic()
+        if now - last_ts < _LOG_THROTTLE_INTERVAL:
+            self._log_throttle = (suppressed + 1, last_ts)
+            return
+        if suppressed:
+            logger.warning("Connection lost (x%d suppressed): %s", suppressed, error)
         else:
-            print(f"[DonkeylabsJob] Reconnection failed, job may be lost", file=sys.stderr)
-        self._reconnect_thread = None
+            logger.warning("Connection lost: %s", error)
+        self._log_throttle = (0, now)
+
+    def _sendall(self, data: Any) -> None:
+        """Write all of data with send(MSG_NOSIGNAL), advancing a zero-copy view over partial writes."""
+        with memoryview(data) as view:
+            offset = 0
+            while offset < len(view):
+                with view[offset:] as chunk:
+                    offset += self._socket.send(chunk, _MSG_NOSIGNAL)
+
+    def _buffer_append(self, used: int, data: Any) -> int:
+        """Copy data into the send buffer after the first `used` bytes, growing it if needed."""
+        end = used + len(data)
+        if end > len(self._send_buf):
+            self._send_buf.extend(bytes(max(end, 2 * len(self._send_buf)) - len(self._send_buf)))
+        self._send_buf[used:end] = data
+        return end
 
     def _send_started(self) -> None:
         """Send a started message to the server."""
         self._send_message({"type": "started"})
 
-    def _start_heartbeat(self) -> None:
-        """Start the background heartbeat thread."""
-
-        def heartbeat_loop():
-            while self._running:
-                self._send_message({"type": "heartbeat"})
-                time.sleep(self._heartbeat_interval)
-
-        self._heartbeat_thread = threading.Thread(target=heartbeat_loop, daemon=True)
-        self._heartbeat_thread.start()
-
     def progress(
         self,
         percent: float,
@@ -270,6 +653,7 @@ class DonkeylabsJob:
 def run_job(
     handler: Callable[[DonkeylabsJob], Any],
     heartbeat_interval: float = 5.0,
+    batch_frames: Optional[bool] = None,
 ) -> None:
     """
     Run a job handler function.
@@ -280,6 +664,7 @@ def run_job(
     Args:
         handler: A function that takes a DonkeylabsJob and returns the result
         heartbeat_interval: How often to send heartbeats (seconds)
+        batch_frames: Send batch frames; defaults to DONKEYLABS_BATCH_FRAMES=1
 
     Example:
         def my_job(job: DonkeylabsJob):
@@ -311,21 +696,29 @@ def run_job(
     if not job_id:
         job_id = os.environ.get("DONKEYLABS_JOB_ID")
     if not socket_path:
-        socket_path = os.environ.get("DONKEYLABS_SOCKET_PATH")
+        env_socket_path = os.environ.get("DONKEYLABS_SOCKET_PATH")
         tcp_port = os.environ.get("DONKEYLABS_TCP_PORT")
-        if tcp_port and not socket_path:
+        # Prefer the Unix socket (no TCP/IP stack on the loopback path), but
+        # if both are set and the socket file is missing, use TCP instead
+        if env_socket_path and (not tcp_port or os.path.exists(env_socket_path)):
+            socket_path = env_socket_path
+        elif tcp_port:
             socket_path = f"tcp://127.0.0.1:{tcp_port}"
 
     if not job_id or not socket_path:
         print("Missing jobId or socketPath", file=sys.stderr)
         sys.exit(1)
 
+    if batch_frames is None:
+        batch_frames = os.environ.get("DONKEYLABS_BATCH_FRAMES") == "1"
+
     job = DonkeylabsJob(
         job_id=job_id,
         name=name or "unknown",
         data=data,
         socket_path=socket_path,
         heartbeat_interval=heartbeat_interval,
+        batch_frames=batch_frames,
     )
 
     try:
@@ -339,7 +732,13 @@ def run_job(
     except Exception as e:
         import traceback
 
-        job.fail(str(e), traceback.format_exc())
+        # Stream the full traceback as error logs, chunk by chunk as it is
+        # formatted, so the failed message itself only carries the innermost frame
+        exc = traceback.TracebackException.from_exception(e)
+        for chunk in exc.format():
+            job.error(chunk.rstrip("\n"))
+        stack = "".join(traceback.format_list(exc.stack[-1:]) + list(exc.format_exception_only()))
+        job.fail(str(e), stack)
         sys.exit(1)
     finally:
         job.disconnect()
@@ -348,9 +747,10 @@ def run_job(
 # Example job handler
 def example_handler(job: DonkeylabsJob) -> Dict[str, Any]:
     """Example job handler that processes data in steps."""
-    job.info(f"Starting job with data: {job.data}")
+    data = job.consume_data()
+    job.info(f"Starting job with data: {data}")
 
-    total_steps = job.data.get("steps", 5)
+    total_steps = data.get("steps", 5)
 
     for i in range(total_steps):
         progress = (i / total_steps) * 100
@@ -10,7 +10,7 @@ import type {
   AnyExternalJobMessage,
   ExternalJobsConfig,
 } from "./external-jobs";
-import { parseJobMessage } from "./external-jobs";
+import { parseJobFrame } from "./external-jobs";
 
 // ============================================
 // Types
@@ -199,6 +199,9 @@ export class ExternalJobSocketServerImpl implements ExternalJobSocketServer {
     this.clientSockets.set(jobId, socket);
     this.onConnect?.(jobId);
 
+    // Decode as a UTF-8 stream so multibyte characters split across reads
+    // are reassembled instead of turning into U+FFFD
+    socket.setEncoding("utf8");
     let buffer = "";
 
     const queue: AnyExternalJobMessage[] = [];
@@ -221,16 +224,16 @@ export class ExternalJobSocketServerImpl implements ExternalJobSocketServer {
     socket.on("data", (data) => {
       buffer += data.toString();
 
-      // Process complete messages (newline-delimited JSON)
+      // Process complete messages (newline-delimited JSON, optionally batched)
       const lines = buffer.split("\n");
       buffer = lines.pop() || ""; // Keep incomplete line in buffer
 
       for (const line of lines) {
         if (!line.trim()) continue;
 
-        const message = parseJobMessage(line);
-        if (message) {
-          queue.push(message);
+        const messages = parseJobFrame(line);
+        if (messages) {
+          queue.push(...messages);
         } else {
           this.onError?.(new Error(`Invalid message: ${line}`), jobId);
         }
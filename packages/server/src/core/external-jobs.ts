@@ -20,6 +20,8 @@ export interface ExternalJobMessage {
   type: ExternalJobMessageType;
   jobId: string;
   timestamp: number;
+  /** Number of earlier messages the wrapper dropped under backpressure */
+  dropped?: number;
 }
 
 export interface StartedMessage extends ExternalJobMessage {
@@ -178,16 +180,43 @@ export function generateSocketPath(socketDir: string, jobId: string): string {
   return `${socketDir}/job_${jobId}.sock`;
 }
 
+/**
+ * Check that a decoded value has the fields every job message carries
+ */
+function isValidJobMessage(parsed: any): parsed is AnyExternalJobMessage {
+  return Boolean(
+    parsed && parsed.type && parsed.jobId && typeof parsed.timestamp === "number"
+  );
+}
+
 /**
  * Parse a message from an external job process
  */
 export function parseJobMessage(data: string): AnyExternalJobMessage | null {
   try {
     const parsed = JSON.parse(data);
-    if (!parsed.type || !parsed.jobId || typeof parsed.timestamp !== "number") {
+    return isValidJobMessage(parsed) ? parsed : null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Parse a line from an external job process into its messages.
+ * A line is either a single message or a batch frame
+ * (`{ type: "batch", jobId, items: [...] }`) wrapping several messages.
+ * Returns null if the line or any batched message is invalid.
+ */
+export function parseJobFrame(data: string): AnyExternalJobMessage[] | null {
+  try {
+    const parsed = JSON.parse(data);
+    if (parsed?.type !== "batch") {
+      return isValidJobMessage(parsed) ? [parsed] : null;
+    }
+    if (!Array.isArray(parsed.items) || !parsed.items.every(isValidJobMessage)) {
       return null;
     }
-    return parsed as AnyExternalJobMessage;
+    return parsed.items;
   } catch {
     return null;
   }
@@ -2,6 +2,7 @@ import { describe, it, expect } from "bun:test";
 import {
   isProcessAlive,
   parseJobMessage,
+  parseJobFrame,
   createInitialPayload,
   generateSocketPath,
   isStartedMessage,
@@ -140,6 +141,58 @@ describe("parseJobMessage", () => {
   });
 });
 
+describe("parseJobFrame", () => {
+  const baseFields = {
+    jobId: "job-123",
+    timestamp: Date.now(),
+  };
+
+  it("should wrap a single message in an array", () => {
+    const msg = JSON.stringify({ ...baseFields, type: "heartbeat" });
+    const result = parseJobFrame(msg);
+    expect(result).toHaveLength(1);
+    expect(result![0].type).toBe("heartbeat");
+  });
+
+  it("should unpack the items of a batch frame in order", () => {
+    const frame = JSON.stringify({
+      type: "batch",
+      jobId: "job-123",
+      items: [
+        { ...baseFields, type: "progress", percent: 10 },
+        { ...baseFields, type: "log", level: "info", message: "hi" },
+        { ...baseFields, type: "completed" },
+      ],
+    });
+    const result = parseJobFrame(frame);
+    expect(result).not.toBeNull();
+    expect(result!.map((m) => m.type)).toEqual(["progress", "log", "completed"]);
+    expect((result![0] as any).percent).toBe(10);
+  });
+
+  it("should return null for invalid JSON", () => {
+    expect(parseJobFrame("{broken")).toBeNull();
+    expect(parseJobFrame("null")).toBeNull();
+  });
+
+  it("should return null when a batch has no items array", () => {
+    const frame = JSON.stringify({ type: "batch", jobId: "job-123" });
+    expect(parseJobFrame(frame)).toBeNull();
+  });
+
+  it("should return null when any batched item is invalid", () => {
+    const frame = JSON.stringify({
+      type: "batch",
+      jobId: "job-123",
+      items: [
+        { ...baseFields, type: "progress", percent: 10 },
+        { type: "log", jobId: "job-123" },
+      ],
+    });
+    expect(parseJobFrame(frame)).toBeNull();
+  });
+});
+
 describe("createInitialPayload", () => {
   it("should create a JSON string with all fields", () => {
     const payload = createInitialPayload(